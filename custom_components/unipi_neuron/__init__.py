@@ -1,13 +1,19 @@
 import asyncio
 import logging
+import random
+import weakref
+from collections import defaultdict
 import aiohttp
+import orjson
 from websockets.exceptions import ConnectionClosedError
 
 from homeassistant.config_entries import ConfigEntry
-from homeassistant.core import HomeAssistant
+from homeassistant.const import EVENT_HOMEASSISTANT_CLOSE
+from homeassistant.core import Event, HomeAssistant, callback
 from homeassistant.exceptions import ConfigEntryNotReady
 from homeassistant import config_entries
 from homeassistant.helpers.dispatcher import async_dispatcher_send
+from homeassistant.helpers.entity import DeviceInfo
 
 from .const import DOMAIN
 from .config_flow import UnipiNeuronConfigFlow
@@ -17,25 +23,17 @@ from .evok_utils import detect_input_device_types
 _LOGGER = logging.getLogger(__name__)
 
 PLATFORMS = ["binary_sensor", "light", "sensor", "cover"]
-
-def cache_getter(self):
-    if not hasattr(self, '_cache'):
-        self._cache = {}
-    return self._cache
-
-UnipiEvokWsClient.cache = property(cache_getter)
-
-def name_getter(self):
-    return getattr(self, '_name', "UniPi")
-UnipiEvokWsClient.name = property(name_getter)
+# Maximum number of distinct circuits queued before a burst is flushed.
+RECEIVE_BATCH_SIZE = 128
+# Upper bound for the exponential reconnect backoff.
+RECONNECT_MAX_SECONDS = 300
 
 async def fetch_rest_all(self):
     url = f"http://{self._ip_addr}/rest/all"
     _LOGGER.debug("Fetching device info from %s", url)
     try:
-        async with aiohttp.ClientSession() as session:
-            async with session.get(url, timeout=5) as resp:
-                data = await resp.json()
+        async with self._http_session.get(url) as resp:
+            data = orjson.loads(await resp.read())
     except Exception as err:
         _LOGGER.warning("Could not fetch /rest/all from %s: %s", url, err)
         return
@@ -45,8 +43,11 @@ async def fetch_rest_all(self):
         circuit = dev_info.get("circuit")
         if device_type and circuit is not None:
             self.cache[(device_type, circuit)] = dev_info
+            self.cache_by_dev.setdefault(device_type, {})[circuit] = dev_info
+            self.values[(device_type, circuit)] = dev_info.get("value")
 
-    _LOGGER.debug("Cache after /rest/all fetch: %s", self.cache)
+    if _LOGGER.isEnabledFor(logging.DEBUG):
+        _LOGGER.debug("Cache after /rest/all fetch: %s", self.cache)
 
 UnipiEvokWsClient.fetch_rest_all = fetch_rest_all
 
@@ -58,63 +59,183 @@ async def evok_full_state_sync_with_rest(self):
 
 UnipiEvokWsClient.evok_full_state_sync = evok_full_state_sync_with_rest
 
+original_evok_state_set = UnipiEvokWsClient.evok_state_set
+
+def evok_state_set_and_dispatch(self, device, circuit, value):
+    """Write a sent value through to the cache and notify every entity of the circuit.
+
+    The write-through suppresses EVOK's echo of the command, so the update
+    is dispatched here instead.
+    """
+    original_evok_state_set(self, device, circuit, value)
+    async_dispatcher_send(self._hass, f"{DOMAIN}_{self.name}_{device}_{circuit}")
+    key = (device, circuit)
+    if key in self._listeners:
+        self._changed.add(key)
+        self._update_event.set()
+
+UnipiEvokWsClient.evok_state_set = evok_state_set_and_dispatch
+
 def evok_state_get(self, device, circuit):
     return self.cache.get((device, circuit))
 
 UnipiEvokWsClient.evok_state_get = evok_state_get
 
+def evok_value(self, key, default=None):
+    """Return the cached value of the (device, circuit) key, or default if unknown."""
+    value = self.values.get(key)
+    return default if value is None else value
+
+UnipiEvokWsClient.evok_value = evok_value
+
+@callback
+def evok_fanout(self, keys):
+    """Call the update callback of the entities listening on the changed circuits."""
+    listeners = self._listeners
+    for key in keys:
+        for entity in listeners.get(key, ()):
+            try:
+                entity._update_callback()
+            except Exception:
+                # Keep the fan-out worker alive for the remaining entities
+                _LOGGER.exception("Error updating %s for %s/%s", entity.entity_id, *key)
+
+UnipiEvokWsClient.evok_fanout = evok_fanout
+
+async def evok_fanout_worker(neuron: UnipiEvokWsClient):
+    """Wait for changed circuits and update the entities listening on them."""
+    event = neuron._update_event
+    changed = neuron._changed
+    while True:
+        await event.wait()
+        event.clear()
+        keys = list(changed)
+        changed.clear()
+        neuron.evok_fanout(keys)
+
+def create_http_session():
+    """Create the keep-alive HTTP session used for /rest/all polls."""
+    connector = aiohttp.TCPConnector(
+        limit=10, limit_per_host=4, ttl_dns_cache=300, keepalive_timeout=30
+    )
+    return aiohttp.ClientSession(
+        connector=connector, timeout=aiohttp.ClientTimeout(total=5)
+    )
+
 async def evok_connection(hass, neuron: UnipiEvokWsClient, reconnect_seconds: int):
+    # Bound to locals once; the closures below run for every message.
+    cache = neuron.cache
+    cache_by_dev = neuron.cache_by_dev
+    values = neuron.values
+    dispatch = async_dispatcher_send
+    domain = DOMAIN
+    pending = {}
+    signal_cache = {}
+    changed = neuron._changed
+    update_event = neuron._update_event
+    flush_handle = None
+
+    def flush_pending():
+        """Send one dispatcher signal per circuit updated in this burst.
+
+        Entities registered in the hub's listeners are updated by
+        evok_fanout_worker, woken once for the whole burst.
+        """
+        nonlocal flush_handle
+        if flush_handle is not None:
+            flush_handle.cancel()
+            flush_handle = None
+        changed.update(pending)
+        batch = list(pending.values())
+        pending.clear()
+        for signal in batch:
+            dispatch(hass, signal)
+        update_event.set()
+
     def evok_update_dispatch_send(name, device, circuit, payload):
-        """Update cache and send dispatcher signal."""
-        
-        _LOGGER.debug("Incoming WebSocket message: %s/%s - %s", device, circuit, payload)
-        
-        # Update cache with new value
+        """Update cache and queue dispatcher signal until the burst is drained."""
+        nonlocal flush_handle
+
+        if _LOGGER.isEnabledFor(logging.DEBUG):
+            _LOGGER.debug("Incoming WebSocket message: %s/%s - %s", device, circuit, payload)
+
         cache_key = (device, circuit)
-        current = neuron.cache.get(cache_key, {})
+        # Binary circuits must not lose an edge (e.g. a short button press)
+        # to coalescing: deliver the pending value before it is overwritten.
+        # Analog, 1-wire and temp readings only need their latest value.
+        if cache_key in pending and device in VALUE_ONLY_DEVICES:
+            new_value = payload.get("value") if isinstance(payload, dict) else payload
+            if new_value != values.get(cache_key):
+                flush_pending()
+
+        # Update cache with new value
+        current = cache.get(cache_key)
+        if not isinstance(current, dict):
+            current = cache[cache_key] = {}
+            cache_by_dev.setdefault(device, {})[circuit] = current
+        # Merge in place; only allocate when the circuit is not cached yet.
         if isinstance(payload, dict):
-            merged = dict(current) if isinstance(current, dict) else {}
             value = payload.get("value")
             if isinstance(value, dict):
-                merged.update(value)
-            merged.update(payload)
-            neuron.cache[cache_key] = merged
+                current.update(value)
+            current.update(payload)
         else:
-            if isinstance(current, dict):
-                current["value"] = payload
-                neuron.cache[cache_key] = current
-            else:
-                neuron.cache[cache_key] = {"value": payload}
-        
-        _LOGGER.debug("SENDING Dispatcher on %s %s with value %s", device, circuit, payload)
-        async_dispatcher_send(hass, f"{DOMAIN}_{name}_{device}_{circuit}")
+            current["value"] = payload
+        values[cache_key] = current.get("value")
+
+        if _LOGGER.isEnabledFor(logging.DEBUG):
+            _LOGGER.debug("SENDING Dispatcher on %s %s with value %s", device, circuit, payload)
+        # Repeated updates of the same circuit collapse into one signal; the
+        # cache already holds the merged latest value.
+        signal = signal_cache.get(cache_key)
+        if signal is None:
+            signal = signal_cache[cache_key] = f"{domain}_{name}_{device}_{circuit}"
+        pending[cache_key] = signal
+        # Messages already buffered by the websocket are received without
+        # yielding, so the flush runs once the buffer has been drained.
+        if len(pending) >= RECEIVE_BATCH_SIZE:
+            flush_pending()
+        elif flush_handle is None:
+            flush_handle = hass.loop.call_soon(flush_pending)
+
+    def reconnect_delay():
+        """Return a full-jitter exponential backoff delay for the next attempt."""
+        nonlocal attempt
+        attempt += 1
+        delay = min(reconnect_seconds * (2 ** (attempt - 1)), RECONNECT_MAX_SECONDS)
+        return random.uniform(0, delay)
 
     """Maintain websocket connection and handle messages."""
+    attempt = 0
     while True:
         try:
             if not await neuron.evok_connect():
-                _LOGGER.warning("Connection failed to %s, retrying in %ds", neuron.name, reconnect_seconds)
-                await asyncio.sleep(reconnect_seconds)
+                delay = reconnect_delay()
+                _LOGGER.warning("Connection failed to %s, retrying in %.1fs", neuron.name, delay)
+                await asyncio.sleep(delay)
                 continue
 
             _LOGGER.info("Connected to %s", neuron.name)
+            attempt = 0
             await neuron.evok_register_default_filter_dev(use_default_filter=True)
             await neuron.evok_full_state_sync()
-            neuron._input_device_types = detect_input_device_types(neuron.cache)
+            neuron._input_device_types = detect_input_device_types(neuron.cache_by_dev)
             if "di" in neuron._input_device_types:
                 await neuron.evok_register_default_filter_dev(use_default_filter=False)
 
+            recv = neuron.evok_receive
             while True:
-                if not await neuron.evok_receive(True, evok_update_dispatch_send):
+                if not await recv(True, evok_update_dispatch_send):
                     break
 
         except ConnectionClosedError:
             _LOGGER.warning("Connection closed for %s", neuron.name)
         except Exception as e:
-            _LOGGER.error("Unexpected error for %s: %s", neuron.name, str(e))
+            _LOGGER.error("Unexpected error for %s: %s", neuron.name, e)
 
-        _LOGGER.info("Reconnecting to %s in %ds", neuron.name, reconnect_seconds)
-        await asyncio.sleep(reconnect_seconds)
+        delay = reconnect_delay()
+        _LOGGER.info("Reconnecting to %s in %.1fs", neuron.name, delay)
+        await asyncio.sleep(delay)
 
 async def async_setup(hass: HomeAssistant, config: dict):
     hass.data.setdefault(DOMAIN, {})
@@ -137,21 +258,49 @@ async def async_setup_entry(hass: HomeAssistant, entry: ConfigEntry) -> bool:
     reconnect_time = data.get("reconnect_time", 30)
 
     neuron = UnipiEvokWsClient(ip_addr, data.get("type", "CUSTOM"), dev_name)
+    neuron._hass = hass
     neuron._ip_addr = ip_addr
-    neuron._name = dev_name
     neuron._devtype = data.get("type", "CUSTOM")
+    # Shared by every entity of this hub
+    neuron._device_info = DeviceInfo(
+        identifiers={(DOMAIN, dev_name)},
+        name=dev_name,
+        manufacturer="UniPi",
+        model=neuron._devtype,
+    )
+    neuron._http_session = create_http_session()
+    # (device, circuit) -> entities updated through evok_fanout; weak so a
+    # reloaded entry does not keep its old entities alive
+    neuron._listeners = defaultdict(weakref.WeakSet)
+    # Circuits changed since evok_fanout_worker last ran, and its wake-up
+    neuron._changed = set()
+    neuron._update_event = asyncio.Event()
 
     try:
         if not await neuron.evok_connect():
             raise ConfigEntryNotReady(f"Could not connect to {ip_addr}")
             
         await neuron.evok_full_state_sync()
-        neuron._input_device_types = detect_input_device_types(neuron.cache)
+        neuron._input_device_types = detect_input_device_types(neuron.cache_by_dev)
     except Exception as err:
+        await neuron._http_session.close()
         raise ConfigEntryNotReady(f"Connection error: {err}") from err
 
     hass.data[DOMAIN][entry.entry_id] = neuron
-    hass.loop.create_task(evok_connection(hass, neuron, reconnect_time))
+
+    async def close_http_session(event: Event) -> None:
+        """Close the HTTP session on shutdown; config entries are not unloaded then."""
+        await neuron._http_session.close()
+
+    entry.async_on_unload(
+        hass.bus.async_listen_once(EVENT_HOMEASSISTANT_CLOSE, close_http_session)
+    )
+    entry.async_create_background_task(
+        hass, evok_fanout_worker(neuron), f"{DOMAIN}_{dev_name}_fanout"
+    )
+    neuron._connection_task = entry.async_create_background_task(
+        hass, evok_connection(hass, neuron, reconnect_time), f"{DOMAIN}_{dev_name}_connection"
+    )
 
     await hass.config_entries.async_forward_entry_setups(entry, PLATFORMS)
     return True
@@ -159,5 +308,8 @@ async def async_setup_entry(hass: HomeAssistant, entry: ConfigEntry) -> bool:
 async def async_unload_entry(hass: HomeAssistant, entry: ConfigEntry) -> bool:
     neuron = hass.data[DOMAIN].pop(entry.entry_id, None)
     if neuron:
+        # Stop reconnecting before the websocket and HTTP session go away
+        neuron._connection_task.cancel()
         await neuron.evok_close()
+        await neuron._http_session.close()
     return await hass.config_entries.async_unload_platforms(entry, PLATFORMS)
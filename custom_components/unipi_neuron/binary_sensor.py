@@ -4,16 +4,31 @@ import logging
 from homeassistant.components.binary_sensor import BinarySensorEntity
 from homeassistant.config_entries import ConfigEntry
 from homeassistant.core import HomeAssistant, callback
-from homeassistant.helpers.entity import DeviceInfo, generate_entity_id
 from homeassistant.util import slugify
 from homeassistant.helpers.entity_platform import AddEntitiesCallback
 from homeassistant.helpers.dispatcher import async_dispatcher_connect
 
 from .const import DOMAIN
+from .entity_utils import unique_entity_id
 from .evok_utils import EVOK_INPUT_DEVICE_TYPES
 
 _LOGGER = logging.getLogger(__name__)
 
+# Common EVOK input values mapped to on/off; 0/1 also cover False/True.
+_BOOL_MAP = {0: False, 1: True, "0": False, "1": True, None: False, "": False}
+
+def _input_state(value, name):
+    """Return the on/off state of an EVOK input value."""
+    try:
+        return _BOOL_MAP[value]
+    except (KeyError, TypeError):  # not in the table, or unhashable
+        pass
+    try:
+        return int(float(value)) == 1
+    except (TypeError, ValueError):
+        _LOGGER.warning("Invalid value for binary sensor '%s': %s", name, value)
+        return False
+
 async def async_setup_entry(
     hass: HomeAssistant,
     entry: ConfigEntry,
@@ -28,17 +43,20 @@ async def async_setup_entry(
     entry_unique_id = entry.unique_id or entry.entry_id
 
     sensors = []
-    input_devices = getattr(unipi_hub, "_input_device_types", EVOK_INPUT_DEVICE_TYPES)
-
-    for (device, circuit), value in unipi_hub.cache.items():
-        if device in input_devices:
+    taken_ids = set()
+    hub_slug = slugify(unipi_hub.name)
+    # Look up both EVOK v2 ("input") and v3 ("di") types so boards exposing
+    # either, or both, get their inputs registered.
+    for device in EVOK_INPUT_DEVICE_TYPES:
+        for circuit, value in unipi_hub.cache_by_dev.get(device, {}).items():
             if isinstance(value, dict) and "alias" in value:
-                name = value["alias"]
-                if name.startswith("al_"):
-                    name = name[3:]
+                name = value["alias"].removeprefix("al_")
             else:
                 name = f"UniPi {device} {circuit}"
-            sensors.append(UnipiBinarySensor(hass, unipi_hub, entry_unique_id, name, circuit, device))
+            entity_id = unique_entity_id(
+                hass, taken_ids, "binary_sensor", f"unipi_{hub_slug}_{device}_{circuit}"
+            )
+            sensors.append(UnipiBinarySensor(unipi_hub, entry_unique_id, name, circuit, device, entity_id))
 
     if sensors:
         async_add_entities(sensors)
@@ -49,28 +67,22 @@ async def async_setup_entry(
 class UnipiBinarySensor(BinarySensorEntity):
     """Representation of binary sensors on UniPi Device."""
 
-    def __init__(self, hass, unipi_hub, entry_unique_id, name, circuit, device):
+    __slots__ = ("_unipi_hub", "_circuit", "_device", "_cache_key", "_state", "_signal")
+
+    def __init__(self, unipi_hub, entry_unique_id, name, circuit, device, entity_id):
         """Initialize Unipi binary sensor."""
-        self._hass = hass
         self._unipi_hub = unipi_hub
         self._circuit = circuit
         self._device = device
+        self._cache_key = (device, circuit)
         self._attr_unique_id = f"{entry_unique_id}_{device}_{circuit}"
         self._attr_name = name
-        self._state = None
-
-        object_id = f"unipi_{slugify(self._unipi_hub.name)}_{device}_{circuit}"
-        self.entity_id = generate_entity_id("binary_sensor.{}", object_id, hass=self._hass)
-
-    @property
-    def device_info(self) -> DeviceInfo:
-        """Return device info so HA groups all sensors under one device."""
-        return DeviceInfo(
-            identifiers={(DOMAIN, self._unipi_hub.name)},
-            name=self._unipi_hub.name,
-            manufacturer="UniPi",
-            model=self._unipi_hub._devtype,
-        )
+        self._attr_device_info = unipi_hub._device_info
+        # Seed from the cache so HA's first state write on add is correct
+        value = unipi_hub.values.get(self._cache_key)
+        self._state = _input_state(value, name)
+        self._signal = f"{DOMAIN}_{unipi_hub.name}_{device}_{circuit}"
+        self.entity_id = entity_id
 
     @property
     def is_on(self):
@@ -79,37 +91,23 @@ class UnipiBinarySensor(BinarySensorEntity):
 
     async def async_added_to_hass(self):
         """Register for dispatcher signals."""
-        signal = f"{DOMAIN}_{self._unipi_hub.name}_{self._device}_{self._circuit}"
-        _LOGGER.debug("Binary Sensor '%s': Connecting signal %s", self._attr_name, signal)
+        _LOGGER.debug("Binary Sensor '%s': Connecting signal %s", self._attr_name, self._signal)
         self.async_on_remove(
-            async_dispatcher_connect(self.hass, signal, self._update_callback)
+            async_dispatcher_connect(self.hass, self._signal, self._update_callback)
         )
-        self._update_callback()
+        # Re-seed without writing; signals sent before the connect were missed
+        # and HA writes the state once the entity has been added
+        value = self._unipi_hub.values.get(self._cache_key)
+        self._state = _input_state(value, self._attr_name)
 
     @callback
     def _update_callback(self):
         """State has changed"""
-        raw_state = self._unipi_hub.evok_state_get(self._device, self._circuit)
-        _LOGGER.debug("Binary Sensor '%s': Raw state received: %s", self._attr_name, raw_state)
-        
-        # Handle list structures (unlikely but possible)
-        if isinstance(raw_state, list) and len(raw_state) > 0:
-            first_item = raw_state[0]
-            if isinstance(first_item, dict):
-                value = first_item.get("value")
-            else:
-                value = first_item
-        elif isinstance(raw_state, dict):
-            value = raw_state.get("value")
-        else:
-            value = raw_state
-
-        # Convert to integer for reliable comparison
-        try:
-            int_value = int(float(value)) if value not in [None, ""] else 0
-        except (TypeError, ValueError):
-            int_value = 0
-            _LOGGER.warning("Invalid value for binary sensor '%s': %s", self._attr_name, value)
-            
-        self._state = int_value == 1
+        value = self._unipi_hub.values.get(self._cache_key)
+        if _LOGGER.isEnabledFor(logging.DEBUG):
+            _LOGGER.debug("Binary Sensor '%s': Raw value received: %s", self._attr_name, value)
+        new_state = _input_state(value, self._attr_name)
+        if new_state == self._state:
+            return
+        self._state = new_state
         self.async_write_ha_state()
@@ -1,20 +1,15 @@
 """Platform for cover integration via Unipi."""
+import asyncio
 import logging
-from datetime import datetime, timedelta
 
 from homeassistant.components.cover import (
-    ATTR_POSITION,
-    ATTR_TILT_POSITION,
     CoverEntity,
     CoverEntityFeature,
 )
 from homeassistant.config_entries import ConfigEntry
 from homeassistant.core import HomeAssistant, callback
-from homeassistant.helpers.entity import DeviceInfo, generate_entity_id
-from homeassistant.util import slugify
 from homeassistant.helpers.entity_platform import AddEntitiesCallback
 from homeassistant.helpers.dispatcher import async_dispatcher_connect
-from homeassistant.helpers.event import async_call_later
 
 from .const import DOMAIN
 
@@ -29,9 +24,18 @@ OPER_STATE_ERROR = "error"
 class UnipiCover(CoverEntity):
     """Representation of a UniPi cover."""
 
-    def __init__(self, hass, unipi_hub, entry_unique_id, name, port_up, port_down, full_close_time, full_open_time, tilt_change_time, min_reverse_time):
-        """Initialize the cover."""
-        self._hass = hass
+    __slots__ = (
+        "_unipi_hub", "_port_up", "_port_down", "_full_close_time", "_full_open_time",
+        "_tilt_change_time", "_min_reverse_time", "_state", "_position", "_tilt_value",
+        "_time_last_movement_start", "_stop_cover_timer", "_cache_key_up", "_cache_key_down",
+        "_signal_up", "_signal_down",
+    )
+
+    def __init__(self, unipi_hub, entry_unique_id, name, port_up, port_down, full_close_time, full_open_time, tilt_change_time, min_reverse_time, entity_id):
+        """Initialize the cover.
+
+        entity_id is assigned by the platform setup with unique_entity_id.
+        """
         self._unipi_hub = unipi_hub
         self._port_up = port_up
         self._port_down = port_down
@@ -41,24 +45,17 @@ class UnipiCover(CoverEntity):
         self._min_reverse_time = min_reverse_time
         self._attr_unique_id = f"{entry_unique_id}_cover_{port_up}_{port_down}"
         self._attr_name = name
+        self._attr_device_info = unipi_hub._device_info
         self._state = OPER_STATE_IDLE
         self._position = None
         self._tilt_value = None
-        self._time_last_movement_start = 0
+        self._time_last_movement_start = 0.0
         self._stop_cover_timer = None
-
-        object_id = f"unipi_{slugify(self._unipi_hub.name)}_cover_{port_up}_{port_down}"
-        self.entity_id = generate_entity_id("cover.{}", object_id, hass=self._hass)
-
-    @property
-    def device_info(self) -> DeviceInfo:
-        """Return device information."""
-        return DeviceInfo(
-            identifiers={(DOMAIN, self._unipi_hub.name)},
-            name=self._unipi_hub.name,
-            manufacturer="UniPi",
-            model=self._unipi_hub._devtype,
-        )
+        self._cache_key_up = ("relay", port_up)
+        self._cache_key_down = ("relay", port_down)
+        self._signal_up = f"{DOMAIN}_{unipi_hub.name}_relay_{port_up}"
+        self._signal_down = f"{DOMAIN}_{unipi_hub.name}_relay_{port_down}"
+        self.entity_id = entity_id
 
     @property
     def supported_features(self):
@@ -88,32 +85,45 @@ class UnipiCover(CoverEntity):
     async def async_open_cover(self, **kwargs):
         """Open the cover."""
         if self._state == OPER_STATE_CLOSING:
-            await self.async_stop_cover()
-        await self._set_relay_state(self._port_up, True)
-        self._unipi_hub.cache[('relay', self._port_up)] = {'value': 1}
-        self._state = OPER_STATE_OPENING
-        self._time_last_movement_start = datetime.now()
-        self.async_write_ha_state()
+            # Release the down relay before driving up; separate, non-atomic frames
+            self._cancel_timer()
+            await self._unipi_hub.evok_send_sequence(
+                [("relay", self._port_down, "0"), ("relay", self._port_up, "1")]
+            )
+            # Record the driven relay first so the cover never reads as idle
+            self._unipi_hub.evok_state_set("relay", self._port_up, 1)
+            self._unipi_hub.evok_state_set("relay", self._port_down, 0)
+        else:
+            await self._set_relay_state(self._port_up, True)
+            self._unipi_hub.evok_state_set("relay", self._port_up, 1)
+        self._time_last_movement_start = self.hass.loop.time()
 
     async def async_close_cover(self, **kwargs):
         """Close the cover."""
         if self._state == OPER_STATE_OPENING:
-            await self.async_stop_cover()
-        await self._set_relay_state(self._port_down, True)
-        self._unipi_hub.cache[('relay', self._port_down)] = {'value': 1}
-        self._state = OPER_STATE_CLOSING
-        self._time_last_movement_start = datetime.now()
-        self.async_write_ha_state()
+            # Release the up relay before driving down; separate, non-atomic frames
+            self._cancel_timer()
+            await self._unipi_hub.evok_send_sequence(
+                [("relay", self._port_up, "0"), ("relay", self._port_down, "1")]
+            )
+            # Record the driven relay first so the cover never reads as idle
+            self._unipi_hub.evok_state_set("relay", self._port_down, 1)
+            self._unipi_hub.evok_state_set("relay", self._port_up, 0)
+        else:
+            await self._set_relay_state(self._port_down, True)
+            self._unipi_hub.evok_state_set("relay", self._port_down, 1)
+        self._time_last_movement_start = self.hass.loop.time()
 
     async def async_stop_cover(self, **kwargs):
         """Stop the cover."""
         self._cancel_timer()
-        await self._set_relay_state(self._port_up, False)
-        await self._set_relay_state(self._port_down, False)
-        self._unipi_hub.cache[('relay', self._port_up)] = {'value': 0}
-        self._unipi_hub.cache[('relay', self._port_down)] = {'value': 0}
-        self._state = OPER_STATE_IDLE
-        self.async_write_ha_state()
+        # Both relays go off, so the order does not matter
+        await asyncio.gather(
+            self._set_relay_state(self._port_up, False),
+            self._set_relay_state(self._port_down, False),
+        )
+        self._unipi_hub.evok_state_set("relay", self._port_up, 0)
+        self._unipi_hub.evok_state_set("relay", self._port_down, 0)
 
     async def _set_relay_state(self, port, state):
         """Set relay state."""
@@ -127,28 +137,27 @@ class UnipiCover(CoverEntity):
 
     async def async_added_to_hass(self):
         """Register callbacks."""
-        signals = [
-            f"{DOMAIN}_{self._unipi_hub.name}_relay_{self._port_up}",
-            f"{DOMAIN}_{self._unipi_hub.name}_relay_{self._port_down}"
-        ]
-        for signal in signals:
-            async_dispatcher_connect(self.hass, signal, self._update_callback)
+        for signal in (self._signal_up, self._signal_down):
+            self.async_on_remove(
+                async_dispatcher_connect(self.hass, signal, self._update_callback)
+            )
 
     @callback
     def _update_callback(self):
         """Handle state updates from UniPi."""
-        up_state = self._unipi_hub.evok_state_get("relay", self._port_up) or {}
-        down_state = self._unipi_hub.evok_state_get("relay", self._port_down) or {}
-        
-        new_state = OPER_STATE_IDLE
-        if up_state.get("value") == 1:
-            new_state = OPER_STATE_OPENING
-        elif down_state.get("value") == 1:
-            new_state = OPER_STATE_CLOSING
-            
-        if new_state != self._state:
-            self._state = new_state
-            self.async_write_ha_state()
+        try:
+            evok_value = self._unipi_hub.evok_value
+            new_state = OPER_STATE_IDLE
+            if evok_value(self._cache_key_up) == 1:
+                new_state = OPER_STATE_OPENING
+            elif evok_value(self._cache_key_down) == 1:
+                new_state = OPER_STATE_CLOSING
+
+            if new_state != self._state:
+                self._state = new_state
+                self.async_write_ha_state()
+        except Exception:  # keep errors out of the dispatcher loop
+            _LOGGER.exception("Error updating UniPi cover '%s'", self._attr_name)
 
 async def async_setup_entry(
     hass: HomeAssistant,
@@ -0,0 +1,19 @@
+from homeassistant.core import HomeAssistant
+from homeassistant.util import slugify
+
+
+def unique_entity_id(hass: HomeAssistant, taken, platform, object_id):
+    """Return a free entity_id for object_id and reserve it in taken.
+
+    Mirrors generate_entity_id's "_2", "_3", ... suffixing and honours the
+    state machine's reservations, while taken holds the ids handed out
+    earlier in the same platform setup, which are not registered yet.
+    """
+    base = f"{platform}.{slugify(object_id)}"
+    entity_id = base
+    index = 2
+    while entity_id in taken or not hass.states.async_available(entity_id):
+        entity_id = f"{base}_{index}"
+        index += 1
+    taken.add(entity_id)
+    return entity_id
@@ -1,15 +1,14 @@
-EVOK_INPUT_DEVICE_TYPES = ("input", "di")
+EVOK_INPUT_DEVICE_TYPES = frozenset(("input", "di"))
 # EVOK v2 reports digital inputs as "input"; EVOK v3 uses "di".
 
 
-def detect_input_device_types(cache):
-    """Detect EVOK input device types from cached /rest/all data."""
-    first_key = next(iter(cache), None)
-    if first_key:
-        first_device = first_key[0]
-        if first_device in EVOK_INPUT_DEVICE_TYPES:
-            return (first_device,)
-    for (device, _), _ in cache.items():
-        if device in EVOK_INPUT_DEVICE_TYPES:
-            return (device,)
-    return EVOK_INPUT_DEVICE_TYPES
+def detect_input_device_types(cache_by_dev):
+    """Detect EVOK input device types from the device-type index of /rest/all data.
+
+    Only the (few) device types are scanned, in the order they were first seen.
+    """
+    device = next((dev for dev in cache_by_dev if dev in EVOK_INPUT_DEVICE_TYPES), None)
+    if device:
+        return (device,)
+    return tuple(EVOK_INPUT_DEVICE_TYPES)
+
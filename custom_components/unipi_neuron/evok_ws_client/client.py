@@ -1,6 +1,7 @@
 import asyncio
 import json
 import logging
+import orjson
 import websockets
 
 _LOGGER = logging.getLogger(__name__)
@@ -19,6 +20,12 @@ class UnipiEvokWsClient:
         self._type = neuron_type
         self._ws = None
         self._name = name
+        self.name = name
+        self.cache = {}
+        # Same entries as cache, indexed as {device: {circuit: info}}
+        self.cache_by_dev = {}
+        # Plain "value" field per (device, circuit), kept in sync with cache
+        self.values = {}
         self._bin_state = {}
         for i in supportedEvokDev:
             self._bin_state[i] = {}
@@ -38,7 +45,8 @@ class UnipiEvokWsClient:
 
         _LOGGER.debug("Closing ws to %s", self._ws_address)
         try:
-            self._ws = await websockets.close(self._ws)
+            await self._ws.close()
+            self._ws = None
         except:
             _LOGGER.warning("Unable to close ws : %s", self._ws_address)
             return False
@@ -54,41 +62,47 @@ class UnipiEvokWsClient:
             _LOGGER.warning("Evok WS conn CLOSED on: %s", self._ws_address)
             return False
 
-        message = json.loads(message)
+        message = orjson.loads(message)
         _LOGGER.debug("Evok Received: %s", message)
 
         if not decode:
             return message
 
-        if isinstance(message, dict):
-            message = [message]
-        elif not isinstance(message, list):
+        # Single-device frames are the common case; handle them without
+        # wrapping them into a list first.
+        if type(message) is dict:
+            self._evok_decode_section(message, state_change_event_callback)
+        elif type(message) is list:
+            for section in message:
+                self._evok_decode_section(section, state_change_event_callback)
+        else:
             _LOGGER.debug("Evok Received unexpected payload type: %s", type(message))
-            return message
-
-        for section in message:
-            if "dev" in section.keys():
-                device = section["dev"]
-                if device in supportedEvokDev:
-                    circuit = section.get("circuit")
-                    if circuit is None:
-                        continue
-
-                    if device in VALUE_ONLY_DEVICES:
-                        if "value" not in section:
-                            continue
-                        new_state = section["value"]
-                    else:
-                        new_state = section
-
-                    old_val = self._bin_state[device].get(circuit)
-                    if old_val != new_state:
-                        self._bin_state[device][circuit] = new_state
-                        if state_change_event_callback:
-                            state_change_event_callback(self._name, device, circuit, section)
 
         return message
 
+    def _evok_decode_section(self, section, state_change_event_callback):
+        if "dev" not in section:
+            return
+        device = section["dev"]
+        if device not in supportedEvokDev:
+            return
+        circuit = section.get("circuit")
+        if circuit is None:
+            return
+
+        if device in VALUE_ONLY_DEVICES:
+            if "value" not in section:
+                return
+            new_state = section["value"]
+        else:
+            new_state = section
+
+        old_val = self._bin_state[device].get(circuit)
+        if old_val != new_state:
+            self._bin_state[device][circuit] = new_state
+            if state_change_event_callback:
+                state_change_event_callback(self._name, device, circuit, section)
+
     async def evok_send(self, device, circuit, value):
         cmd = {}
         cmd["cmd"] = "set"
@@ -99,6 +113,18 @@ class UnipiEvokWsClient:
         _LOGGER.debug("Evok SEND: %s", cmdjson)
         await self._evok_send_over_ws(cmdjson)
 
+    async def evok_send_sequence(self, commands):
+        # EVOK accepts a single "set" command per websocket frame, so the
+        # (device, circuit, value) commands are written back to back, in order.
+        # The sequence is not atomic: a failure can leave it partly applied.
+        cmdjsons = [
+            json.dumps({"cmd": "set", "dev": device, "circuit": circuit, "value": value})
+            for device, circuit, value in commands
+        ]
+        _LOGGER.debug("Evok SEND: %s", cmdjsons)
+        for cmdjson in cmdjsons:
+            await self._evok_send_over_ws(cmdjson)
+
     async def evok_send_raw(self, data):
         await self._evok_send_over_ws(data)
 
@@ -124,6 +150,20 @@ class UnipiEvokWsClient:
         _LOGGER.debug("Setting Filter: %s", cmdjson)
         await self._evok_send_over_ws(cmdjson)
 
+    def evok_state_set(self, device, circuit, value):
+        # Write a value we just sent through to the local state, so the
+        # matching EVOK echo is recognised as unchanged and not re-dispatched
+        key = (device, circuit)
+        current = self.cache.get(key)
+        if isinstance(current, dict):
+            current["value"] = value
+        else:
+            current = self.cache[key] = {"value": value}
+            self.cache_by_dev.setdefault(device, {})[circuit] = current
+        self.values[key] = value
+        if device in VALUE_ONLY_DEVICES:
+            self._bin_state[device][circuit] = value
+
     def evok_state_get(self, device, circuit):
         try:
             return self._bin_state[device][circuit]
@@ -1,6 +1,5 @@
 """Platform for light integration via Unipi."""
 import logging
-import asyncio
 
 from homeassistant.components.light import (
     ATTR_BRIGHTNESS,
@@ -9,17 +8,23 @@ from homeassistant.components.light import (
 )
 from homeassistant.config_entries import ConfigEntry
 from homeassistant.core import HomeAssistant, callback
-from homeassistant.helpers.entity import DeviceInfo, generate_entity_id
 from homeassistant.util import slugify
 from homeassistant.helpers.entity_platform import AddEntitiesCallback
 from homeassistant.helpers.dispatcher import async_dispatcher_connect
 from websockets.exceptions import ConnectionClosedError
 
 from .const import DOMAIN
+from .entity_utils import unique_entity_id
 
 _LOGGER = logging.getLogger(__name__)
 
-LIGHT_DEVICES = ("relay", "led", "ro", "do")
+LIGHT_DEVICES = frozenset(("relay", "led", "ro", "do"))
+# Brightness (0..255) <-> PWM duty (0..100%) conversions
+_BRIGHTNESS_TO_DUTY = tuple(round(b / 255 * 100) for b in range(256))
+_DUTY_TO_BRIGHTNESS = tuple(min(255, int(d / 100 * 255)) for d in range(101))
+# EVOK pwm_duty payload values
+_PWM_OFF = {"pwm_duty": "0"}
+_PWM_STRINGS = tuple(str(d) for d in range(101))
 
 async def async_setup_entry(hass: HomeAssistant, entry: ConfigEntry, async_add_entities: AddEntitiesCallback):
     """Set up the Unipi Lights from a config entry."""
@@ -30,147 +35,169 @@ async def async_setup_entry(hass: HomeAssistant, entry: ConfigEntry, async_add_e
 
     entry_unique_id = entry.unique_id or entry.entry_id
 
-    lights = []
-    for (device, circuit), value in unipi_hub.cache.items():
-        if device in LIGHT_DEVICES:
-            mode = "on_off"
-            if isinstance(value, dict) and "alias" in value:
-                name = value["alias"]
-                if name.startswith("al_"):
-                    name = name[3:]
-            else:
-                name = f"UniPi Light {device} {circuit}"
-            lights.append(
-                UnipiLight(hass, unipi_hub, entry_unique_id, name, circuit, device, mode)
-            )
+    taken_ids = set()
+    hub_slug = slugify(unipi_hub.name)
+    # Every output is set up in "on_off" mode for now; "pwm" selects UnipiPwmLight
+    mode = "on_off"
+    light_class = UnipiPwmLight if mode == "pwm" else UnipiOnOffLight
+    lights = [
+        light_class(
+            unipi_hub, entry_unique_id, _derive_name(device, circuit, value), circuit, device,
+            unique_entity_id(hass, taken_ids, "light", f"unipi_{hub_slug}_{device}_{circuit}"),
+        )
+        for (device, circuit), value in unipi_hub.cache.items()
+        if device in LIGHT_DEVICES
+    ]
 
     async_add_entities(lights)
     _LOGGER.debug("Added %d UniPi lights for entry '%s'", len(lights), entry.title)
 
 
+def _derive_name(device, circuit, value):
+    """Return the entity name from the EVOK alias, or a generic fallback."""
+    if isinstance(value, dict) and "alias" in value:
+        return value["alias"].removeprefix("al_")
+    return f"UniPi Light {device} {circuit}"
+
+
 class UnipiLight(LightEntity):
-    """Representation of a Light attached to a UniPi relay or digital output."""
+    """Base for a Light attached to a UniPi relay or digital output."""
+
+    __slots__ = ("_unipi_hub", "_circuit", "_device", "_cache_key", "_signal", "_state")
 
-    def __init__(self, hass, unipi_hub, entry_unique_id, name, circuit, device, mode):
+    def __init__(self, unipi_hub, entry_unique_id, name, circuit, device, entity_id):
         """Initialize the UniPi Light."""
-        self._hass = hass
         self._unipi_hub = unipi_hub
         self._circuit = circuit
         self._device = device
-        self._dimmable = (mode == "pwm")
+        self._cache_key = (device, circuit)
         self._attr_unique_id = f"{entry_unique_id}_{device}_{circuit}"
         self._attr_name = name
-        self._lock = asyncio.Lock()
-        
-        object_id = f"unipi_{slugify(self._unipi_hub.name)}_{device}_{circuit}"
-        self.entity_id = generate_entity_id("light.{}", object_id, hass=self._hass)
-
-        if self._dimmable:
-            self._attr_supported_color_modes = {ColorMode.BRIGHTNESS}
-            self._attr_color_mode = ColorMode.BRIGHTNESS
-            self._brightness = 0
-        else:
-            self._attr_supported_color_modes = {ColorMode.ONOFF}
-            self._attr_color_mode = ColorMode.ONOFF
-            self._brightness = None
-
+        self._attr_device_info = unipi_hub._device_info
+        self._signal = f"{DOMAIN}_{unipi_hub.name}_{device}_{circuit}"
         self._state = False
-
-    @property
-    def device_info(self) -> DeviceInfo:
-        """Return device information for this entity to show up as a device."""
-        return DeviceInfo(
-            identifiers={(DOMAIN, self._unipi_hub.name)},
-            name=self._unipi_hub.name,
-            manufacturer="UniPi",
-            model=self._unipi_hub._devtype,
-        )
+        self.entity_id = entity_id
 
     @property
     def is_on(self):
         """Return true if light is on."""
         return self._state
 
+    async def async_added_to_hass(self):
+        """Subscribe to dispatch updates for real-time changes."""
+        _LOGGER.debug("Connecting signal: %s for UniPi Light '%s'", self._signal, self._attr_name)
+        self.async_on_remove(
+            async_dispatcher_connect(self.hass, self._signal, self._update_callback)
+        )
+        self._update_callback()
+
+
+class UnipiOnOffLight(UnipiLight):
+    """Light switched on and off by a UniPi relay or digital output."""
+
+    __slots__ = ()
+
+    _attr_supported_color_modes = {ColorMode.ONOFF}
+    _attr_color_mode = ColorMode.ONOFF
+
+    async def async_turn_on(self, **kwargs):
+        """Instruct the light to turn on."""
+        try:
+            if _LOGGER.isEnabledFor(logging.DEBUG):
+                _LOGGER.debug("Turn ON light '%s' (on_off mode)", self._attr_name)
+            await self._unipi_hub.evok_send(self._device, self._circuit, "1")
+            # Update cache immediately; this notifies every entity of the circuit
+            self._unipi_hub.evok_state_set(self._device, self._circuit, 1)
+        except ConnectionClosedError as e:
+            _LOGGER.warning("Connection closed when turning on light '%s': %s", self._attr_name, e)
+
+    async def async_turn_off(self, **kwargs):
+        """Instruct the light to turn off."""
+        try:
+            if _LOGGER.isEnabledFor(logging.DEBUG):
+                _LOGGER.debug("Turn OFF light '%s'", self._attr_name)
+            await self._unipi_hub.evok_send(self._device, self._circuit, "0")
+            # Update cache immediately; this notifies every entity of the circuit
+            self._unipi_hub.evok_state_set(self._device, self._circuit, 0)
+        except ConnectionClosedError as e:
+            _LOGGER.warning("Connection closed when turning off light '%s': %s", self._attr_name, e)
+
+    @callback
+    def _update_callback(self):
+        """Receive update from the hub (dispatcher)."""
+        try:
+            new_state = bool(self._unipi_hub.evok_value(self._cache_key, 0))
+            if new_state == self._state:
+                return
+            self._state = new_state
+            self.async_write_ha_state()
+        except Exception:  # keep errors out of the dispatcher loop
+            _LOGGER.exception("Error updating UniPi light '%s'", self._attr_name)
+
+
+class UnipiPwmLight(UnipiLight):
+    """Light dimmed through the PWM duty cycle of a UniPi digital output."""
+
+    __slots__ = ("_brightness",)
+
+    _attr_supported_color_modes = {ColorMode.BRIGHTNESS}
+    _attr_color_mode = ColorMode.BRIGHTNESS
+
+    def __init__(self, unipi_hub, entry_unique_id, name, circuit, device, entity_id):
+        """Initialize the dimmable UniPi Light."""
+        super().__init__(unipi_hub, entry_unique_id, name, circuit, device, entity_id)
+        self._brightness = 0
+
     @property
     def brightness(self):
-        """Return the brightness of the light (0..255), or None if not dimmable."""
+        """Return the brightness of the light (0..255)."""
         return self._brightness
 
     async def async_turn_on(self, **kwargs):
         """Instruct the light to turn on."""
-        async with self._lock:
-            try:
-                if self._dimmable:
-                    new_brightness = kwargs.get(ATTR_BRIGHTNESS, 255)
-                    duty_value = round(new_brightness / 255 * 100)
-                    _LOGGER.info(
-                        "Turn ON dimmable light '%s' brightness=%d => duty=%d%%",
-                        self._attr_name, new_brightness, duty_value
-                    )
-                    dict_to_send = {"pwm_duty": str(duty_value)}
-                    await self._unipi_hub.evok_send(self._device, self._circuit, dict_to_send)
-                    # Update cache immediately
-                    self._unipi_hub.cache[(self._device, self._circuit)] = {'value': duty_value}
-                    self._brightness = new_brightness
-                    self._state = True
-                else:
-                    _LOGGER.info("Turn ON light '%s' (on_off mode)", self._attr_name)
-                    await self._unipi_hub.evok_send(self._device, self._circuit, "1")
-                    # Update cache immediately
-                    self._unipi_hub.cache[(self._device, self._circuit)] = {'value': 1}
-                    self._state = True
-
-                self.async_write_ha_state()
-            except ConnectionClosedError as e:
-                _LOGGER.warning("Connection closed when turning on light '%s': %s", self._attr_name, e)
+        try:
+            new_brightness = kwargs.get(ATTR_BRIGHTNESS, 255)
+            duty_value = _BRIGHTNESS_TO_DUTY[new_brightness]
+            if _LOGGER.isEnabledFor(logging.DEBUG):
+                _LOGGER.debug(
+                    "Turn ON dimmable light '%s' brightness=%d => duty=%d%%",
+                    self._attr_name, new_brightness, duty_value
+                )
+            await self._unipi_hub.evok_send(
+                self._device, self._circuit, {"pwm_duty": _PWM_STRINGS[duty_value]}
+            )
+            # Update cache immediately; this notifies every entity of the circuit
+            self._unipi_hub.evok_state_set(self._device, self._circuit, duty_value)
+        except ConnectionClosedError as e:
+            _LOGGER.warning("Connection closed when turning on light '%s': %s", self._attr_name, e)
 
     async def async_turn_off(self, **kwargs):
         """Instruct the light to turn off."""
-        async with self._lock:
-            try:
-                if self._dimmable:
-                    _LOGGER.info("Turn OFF dimmable light '%s' => set duty=0%%", self._attr_name)
-                    dict_to_send = {"pwm_duty": "0"}
-                    await self._unipi_hub.evok_send(self._device, self._circuit, dict_to_send)
-                    # Update cache immediately
-                    self._unipi_hub.cache[(self._device, self._circuit)] = {'value': 0}
-                    self._brightness = 0
-                    self._state = False
-                else:
-                    _LOGGER.info("Turn OFF light '%s'", self._attr_name)
-                    await self._unipi_hub.evok_send(self._device, self._circuit, "0")
-                    # Update cache immediately
-                    self._unipi_hub.cache[(self._device, self._circuit)] = {'value': 0}
-                    self._state = False
-
-                self.async_write_ha_state()
-            except ConnectionClosedError as e:
-                _LOGGER.warning("Connection closed when turning off light '%s': %s", self._attr_name, e)
-
-    async def async_added_to_hass(self):
-        """Subscribe to dispatch updates for real-time changes."""
-        signal = f"{DOMAIN}_{self._unipi_hub.name}_{self._device}_{self._circuit}"
-        _LOGGER.debug("Connecting signal: %s for UniPi Light '%s'", signal, self._attr_name)
-        async_dispatcher_connect(self.hass, signal, self._update_callback)
-        self._update_callback()
+        try:
+            if _LOGGER.isEnabledFor(logging.DEBUG):
+                _LOGGER.debug("Turn OFF dimmable light '%s' => set duty=0%%", self._attr_name)
+            await self._unipi_hub.evok_send(self._device, self._circuit, _PWM_OFF)
+            # Update cache immediately; this notifies every entity of the circuit
+            self._unipi_hub.evok_state_set(self._device, self._circuit, 0)
+        except ConnectionClosedError as e:
+            _LOGGER.warning("Connection closed when turning off light '%s': %s", self._attr_name, e)
 
     @callback
     def _update_callback(self):
         """Receive update from the hub (dispatcher)."""
-        raw_state = self._unipi_hub.evok_state_get(self._device, self._circuit)
-        if isinstance(raw_state, dict):
-            raw_value = raw_state.get("value", 0)
-        else:
-            raw_value = raw_state if raw_state is not None else 0
-
-        if self._dimmable:
+        try:
+            raw_value = self._unipi_hub.evok_value(self._cache_key, 0)
             if isinstance(raw_value, (int, float)) and raw_value > 0:
-                self._brightness = min(255, int(raw_value / 100 * 255))
-                self._state = True
+                new_brightness = _DUTY_TO_BRIGHTNESS[min(100, int(raw_value))]
+                new_state = True
             else:
-                self._brightness = 0
-                self._state = False
-        else:
-            self._state = bool(raw_value)
-
-        self.async_write_ha_state()
+                new_brightness = 0
+                new_state = False
+
+            if (new_state, new_brightness) == (self._state, self._brightness):
+                return
+            self._state = new_state
+            self._brightness = new_brightness
+            self.async_write_ha_state()
+        except Exception:  # keep errors out of the dispatcher loop
+            _LOGGER.exception("Error updating UniPi light '%s'", self._attr_name)
@@ -1,24 +1,38 @@
+import asyncio
 import logging
+from operator import itemgetter
+from sys import intern
+from types import MappingProxyType
 
 from homeassistant.config_entries import ConfigEntry
 from homeassistant.core import HomeAssistant, callback
 from homeassistant.components.sensor import SensorEntity
-from homeassistant.helpers.entity import DeviceInfo, generate_entity_id
+from homeassistant.helpers.entity import generate_entity_id
 from homeassistant.util import slugify
 from homeassistant.helpers.entity_platform import AddEntitiesCallback
-from homeassistant.helpers.dispatcher import async_dispatcher_connect
 
 from .const import DOMAIN
 
 _LOGGER = logging.getLogger(__name__)
 
-MEASUREMENT_MAPPING = {
-    "temp": {"unit": "°C", "device_class": "temperature"},
-    "humidity": {"unit": "%", "device_class": "humidity"},
-    "vad": {"unit": "V", "device_class": None},
-    "vdd": {"unit": "V", "device_class": None},
-    "voltage": {"unit": "V", "device_class": "voltage"},
-}
+# measurement -> (unit, device_class)
+_MEASUREMENT_INFO = MappingProxyType({
+    "temp": ("°C", "temperature"),
+    "humidity": ("%", "humidity"),
+    "vad": ("V", None),
+    "vdd": ("V", None),
+    "voltage": ("V", "voltage"),
+})
+_VALID_MEAS = frozenset(_MEASUREMENT_INFO)
+_SENSOR_DEVICES = frozenset(("temp", "1wdevice", "ai"))
+_ADD_CHUNK_SIZE = 50
+_ADD_CHUNK_THRESHOLD = 100
+_UNSET = object()
+
+def _chunked(items, size):
+    """Yield successive slices of items with at most size elements."""
+    for start in range(0, len(items), size):
+        yield items[start:start + size]
 
 async def async_setup_entry(hass: HomeAssistant, entry: ConfigEntry, async_add_entities: AddEntitiesCallback):
     """Set up UniPi sensors based on a config entry."""
@@ -31,25 +45,36 @@ async def async_setup_entry(hass: HomeAssistant, entry: ConfigEntry, async_add_e
 
     sensors = []
     for (device, circuit), value in unipi_hub.cache.items():
-        alias = None
-        if isinstance(value, dict) and "alias" in value:
-            alias = value["alias"]
-            if alias.startswith("al_"):
-                alias = alias[3:]
+        if device not in _SENSOR_DEVICES:
+            continue
+        is_dict = isinstance(value, dict)
+        alias = value.get("alias") if is_dict else None
+        if alias:
+            alias = alias.removeprefix("al_")
 
         if device == "temp":
             name = alias if alias else f"UniPi {device} {circuit}"
             sensors.append(Unipi1WireSensor(hass, unipi_hub, entry_unique_id, name, device, circuit, measurement="temp"))
-        elif device == "1wdevice" and isinstance(value, dict):
-            for measurement in MEASUREMENT_MAPPING.keys():
-                if measurement in value:
-                    meas_name = f"{alias} {measurement}" if alias else f"UniPi {device} {circuit} {measurement}"
-                    sensors.append(Unipi1WireSensor(hass, unipi_hub, entry_unique_id, meas_name, device, circuit, measurement))
+        elif device == "1wdevice" and is_dict:
+            # Only probe the measurements this device actually reports
+            sensors.extend(
+                Unipi1WireSensor(
+                    hass, unipi_hub, entry_unique_id,
+                    f"{alias} {measurement}" if alias else f"UniPi {device} {circuit} {measurement}",
+                    device, circuit, measurement,
+                )
+                for measurement in _VALID_MEAS.intersection(value)
+            )
         elif device == "ai":
             name = alias if alias else f"UniPi {device} {circuit}"
             sensors.append(Unipi1WireSensor(hass, unipi_hub, entry_unique_id, name, device, circuit, measurement="voltage"))
     
-    if sensors:
+    if len(sensors) > _ADD_CHUNK_THRESHOLD:
+        # Yield to the loop between batches so large hubs don't stall startup
+        for chunk in _chunked(sensors, _ADD_CHUNK_SIZE):
+            async_add_entities(chunk)
+            await asyncio.sleep(0)
+    elif sensors:
         async_add_entities(sensors)
     else:
         _LOGGER.debug("No 1-wire, temp or analog input sensors found for UniPi '%s'", unipi_hub.name)
@@ -57,73 +82,80 @@ async def async_setup_entry(hass: HomeAssistant, entry: ConfigEntry, async_add_e
 class Unipi1WireSensor(SensorEntity):
     """Representation of a UniPi 1-Wire, temp or analog input sensor."""
 
+    __slots__ = ("_unipi_hub", "_device", "_circuit", "_measurement", "_cache_key", "_extract", "_digits", "_last_written", "_last_raw")
+
     def __init__(self, hass, unipi_hub, entry_unique_id, name, device, circuit, measurement):
         """Initialize the sensor."""
-        self._hass = hass
         self._unipi_hub = unipi_hub
         self._device = device
         self._circuit = circuit
         self._measurement = measurement
-        self._attr_unique_id = f"{entry_unique_id}_{device}_{circuit}_{measurement}"
-        self._attr_name = name
-        mapping_info = MEASUREMENT_MAPPING.get(measurement, {"unit": None, "device_class": None})
-        self._attr_native_unit_of_measurement = mapping_info["unit"]
-        self._attr_device_class = mapping_info["device_class"]
+        self._cache_key = (device, circuit)
+        self._attr_unique_id = intern(f"{entry_unique_id}_{device}_{circuit}_{measurement}")
+        self._attr_name = intern(name)
+        self._attr_device_info = unipi_hub._device_info
+        unit, device_class = _MEASUREMENT_INFO.get(measurement, (None, None))
+        self._attr_native_unit_of_measurement = unit
+        self._attr_device_class = device_class
         self._attr_native_value = None
+        # temp and ai report a plain "value"; 1-wire devices one key per measurement
+        self._extract = itemgetter("value" if device in ("temp", "ai") else measurement)
+        self._digits = 2 if measurement == "humidity" else None
+        # (native_value, available) of the last state write
+        self._last_written = (None, False)
+        # Raw field value the current state was parsed from
+        self._last_raw = _UNSET
 
         object_id = f"unipi_{slugify(self._unipi_hub.name)}_{device}_{circuit}_{measurement}"
-        self.entity_id = generate_entity_id("sensor.{}", object_id, hass=self._hass)
-
-    @property
-    def device_info(self) -> DeviceInfo:
-        """Link this sensor to a device in the device registry."""
-        return DeviceInfo(
-            identifiers={(DOMAIN, self._unipi_hub.name)},
-            name=self._unipi_hub.name,
-            manufacturer="UniPi",
-            model=self._unipi_hub._devtype,
-        )
+        self.entity_id = generate_entity_id("sensor.{}", object_id, hass=hass)
 
     async def async_added_to_hass(self):
-        """Register callbacks when entity is added."""
-        signal = f"{DOMAIN}_{self._unipi_hub.name}_{self._device}_{self._circuit}"
-        _LOGGER.debug("Connecting signal: %s for UniPi Sensor '%s'", signal, self._attr_name)
-        async_dispatcher_connect(self.hass, signal, self._update_callback)
-        # Initial state update
-        self._update_callback()
+        """Register with the hub's fan-out when entity is added."""
+        listeners = self._unipi_hub._listeners[self._cache_key]
+        _LOGGER.debug("Registering UniPi Sensor '%s' for %s/%s", self._attr_name, self._device, self._circuit)
+        listeners.add(self)
+        self.async_on_remove(lambda: listeners.discard(self))
+        # Parse the initial state without writing it; Home Assistant writes
+        # it once the entity has been added
+        self._refresh_state()
+        self._last_written = (self._attr_native_value, self._attr_available)
+
+    def _refresh_state(self):
+        """Parse the cached circuit data; return False if the reported field is unchanged."""
+        device_data = self._unipi_hub.cache.get(self._cache_key)
 
-    @callback
-    def _update_callback(self):
-        """Handle updated data from UniPi hub."""
-        device_data = self._unipi_hub.evok_state_get(self._device, self._circuit)
-        
         if not isinstance(device_data, dict):
             _LOGGER.debug("Sensor '%s' received invalid data: %s", self._attr_name, device_data)
             self._attr_available = False
-            self.async_write_ha_state()
-            return
+            self._last_raw = _UNSET
+        else:
+            try:
+                raw_value = self._extract(device_data)
+            except KeyError:
+                raw_value = None
+            if raw_value == self._last_raw:
+                # The circuit changed, but not the field this sensor reports
+                return False
+            self._last_raw = raw_value
+            self._attr_available = True
+            try:
+                value = 0.0 if raw_value is None or raw_value == "" else float(raw_value)
+                if self._digits is not None:
+                    value = round(value, self._digits)
+                self._attr_native_value = value
+                _LOGGER.debug("Sensor '%s' updated: %s = %s", self._attr_name, self._measurement, self._attr_native_value)
+            except (TypeError, ValueError) as err:
+                _LOGGER.warning("Error parsing %s data: %s (raw value: %s)", self._attr_name, err, raw_value)
+                self._attr_native_value = None
+        return True
 
-        self._attr_available = True
-        try:
-            # Handle different device types
-            if self._device == "temp":
-                raw_value = device_data.get("value", 0)
-                self._attr_native_value = float(raw_value) if raw_value not in [None, ""] else 0.0
-            elif self._device == "1wdevice":
-                raw_value = device_data.get(self._measurement, 0)
-                if raw_value not in [None, ""]:
-                    value = float(raw_value)
-                    if self._measurement == "humidity":
-                        value = round(value, 2)
-                    self._attr_native_value = value
-                else:
-                    self._attr_native_value = 0.0
-            elif self._device == "ai" and self._measurement == "voltage":
-                raw_value = device_data.get("value", 0)
-                self._attr_native_value = float(raw_value) if raw_value not in [None, ""] else 0.0
-            _LOGGER.debug("Sensor '%s' updated: %s = %s", self._attr_name, self._measurement, self._attr_native_value)
-        except (TypeError, ValueError) as err:
-            _LOGGER.warning("Error parsing %s data: %s (raw value: %s)", self._attr_name, err, raw_value)
-            self._attr_native_value = None
-            
+    @callback
+    def _update_callback(self):
+        """Handle updated data from UniPi hub."""
+        if not self._refresh_state():
+            return
+        written = (self._attr_native_value, self._attr_available)
+        if written == self._last_written:
+            return
+        self._last_written = written
         self.async_write_ha_state()